@@ -1,11 +1,14 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 from typing import Optional, List, Any
 import asyncio
+import hashlib
 
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from flow import create_qa_flow
+from utils.vectordb import get_document
 
 # App metadata improves the generated OpenAPI / Swagger UI
 app = FastAPI(
@@ -22,13 +25,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads (chat answers, document content) for slow connections
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Create a single flow instance to reuse across requests
 flow = create_qa_flow()
 
 
+# Length of the snippet returned per document in compact mode
+SNIPPET_LENGTH = 200
+
+# Chunk content doesn't change between ingestions, so clients may reuse it for a while
+DOCUMENT_CACHE_CONTROL = "public, max-age=3600"
+
+
 class ChatRequest(BaseModel):
     user_id: Optional[str] = "default_user"
     question: str
+    # When set, return deduplicated `documents` instead of full `retrieved_contexts`
+    compact: Optional[bool] = False
+
+
+class DocumentSummary(BaseModel):
+    id: Optional[str]
+    score: Optional[float]
+    snippet: str
 
 
 class ChatResponse(BaseModel):
@@ -36,6 +57,42 @@ class ChatResponse(BaseModel):
     decision: Optional[str]
     refined_question: Optional[str]
     retrieved_contexts: Optional[List[Any]]
+    documents: Optional[List[DocumentSummary]] = None
+
+
+class DocumentResponse(BaseModel):
+    id: str
+    content: Optional[str]
+
+
+def _snippet(content: Optional[str]) -> str:
+    """Cut content down to SNIPPET_LENGTH, preferring a word boundary."""
+    content = (content or "").strip()
+    if len(content) <= SNIPPET_LENGTH:
+        return content
+    cut = content[:SNIPPET_LENGTH].rsplit(" ", 1)[0]
+    return cut.rstrip() + "..."
+
+
+def summarize_contexts(retrieved_contexts: List[Any]) -> List[DocumentSummary]:
+    """Flatten the per-query contexts into unique documents, keeping the best score.
+
+    Chunks retrieved by several sub-queries appear once; results are ordered by score.
+    """
+    best = {}
+    for ctx in retrieved_contexts or []:
+        for doc in ctx:
+            doc_id = doc.get("id")
+            # Chunks without an id can't be looked up later, so dedupe them by content
+            key = str(doc_id) if doc_id is not None else ("content", doc.get("content"))
+            score = doc.get("score")
+            if key not in best or (score or 0) > (best[key].score or 0):
+                best[key] = DocumentSummary(
+                    id=str(doc_id) if doc_id is not None else None,
+                    score=score,
+                    snippet=_snippet(doc.get("content")),
+                )
+    return sorted(best.values(), key=lambda d: d.score or 0, reverse=True)
 
 
 @app.get("/api/health")
@@ -67,6 +124,15 @@ async def chat_endpoint(req: ChatRequest, cultura: str):
         # run the async flow
         await flow.run_async(shared)
 
+        if req.compact:
+            return ChatResponse(
+                answer=shared.get("answer"),
+                decision=shared.get("decision"),
+                refined_question=shared.get("refined_question"),
+                retrieved_contexts=None,
+                documents=summarize_contexts(shared.get("retrieved_contexts")),
+            )
+
         return ChatResponse(
             answer=shared.get("answer"),
             decision=shared.get("decision"),
@@ -76,3 +142,26 @@ async def chat_endpoint(req: ChatRequest, cultura: str):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@app.get("/api/documents/{doc_id}", response_model=DocumentResponse)
+def document_endpoint(doc_id: str, request: Request, response: Response):
+    """Return the full content of a retrieved chunk.
+
+    Served from the server-side LRU when possible. Responses carry an ETag so
+    clients revalidating with `If-None-Match` get a 304 without the body.
+    """
+    doc = get_document(doc_id)
+    if doc is None:
+        raise HTTPException(status_code=404, detail=f"Document {doc_id} not found")
+
+    content = doc.get("content")
+    etag = '"' + hashlib.sha256((content or "").encode("utf-8")).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": DOCUMENT_CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return DocumentResponse(id=doc_id, content=content)
@@ -1,3 +1,4 @@
+import { useState } from "react";
 import { FileText, ExternalLink, Calendar } from "lucide-react";
 import { Card } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
@@ -8,6 +9,7 @@ import rehypeHighlight from 'rehype-highlight';
 interface DocumentCardProps {
   document: {
     id: string;
+    documentId?: string;
     title: string;
     excerpt: string;
     source: string;
@@ -18,6 +20,27 @@ interface DocumentCardProps {
 }
 
 export function DocumentCard({ document }: DocumentCardProps) {
+  const [fullContent, setFullContent] = useState<string | null>(null);
+  const [isLoadingContent, setIsLoadingContent] = useState(false);
+
+  // Compact chat responses only carry a snippet; fetch the full chunk on first click
+  const handleClick = async () => {
+    if (!document.documentId || fullContent !== null || isLoadingContent) return;
+    setIsLoadingContent(true);
+    try {
+      const response = await fetch(`/api/documents/${encodeURIComponent(document.documentId)}`);
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+      }
+      const data: { id: string; content?: string | null } = await response.json();
+      setFullContent(data.content || document.excerpt);
+    } catch (error) {
+      console.error('Error loading document:', error);
+    } finally {
+      setIsLoadingContent(false);
+    }
+  };
+
   const typeColors = {
     research: "bg-primary/10 text-primary border-primary/20",
     guide: "bg-accent/10 text-accent-foreground border-accent/20",
@@ -33,7 +56,7 @@ export function DocumentCard({ document }: DocumentCardProps) {
   };
 
   return (
-    <Card className="p-4 space-y-3 hover:shadow-medium transition-all duration-300 hover:scale-[1.02] cursor-pointer border-border/50">
+    <Card onClick={handleClick} className="p-4 space-y-3 hover:shadow-medium transition-all duration-300 hover:scale-[1.02] cursor-pointer border-border/50">
       <div className="flex items-start justify-between gap-2">
         <div className="flex items-start gap-2">
           <FileText className="h-4 w-4 text-primary mt-0.5" />
@@ -76,7 +99,7 @@ export function DocumentCard({ document }: DocumentCardProps) {
             td: ({ children }) => <td className="border border-border p-1 text-muted-foreground text-xs">{children}</td>,
           }}
         >
-          {document.excerpt}
+          {fullContent ?? document.excerpt}
         </ReactMarkdown>
       </div>
       
@@ -4,6 +4,7 @@ import { DocumentCard } from "./DocumentCard";
 
 interface Document {
   id: string;
+  documentId?: string;
   title: string;
   excerpt: string;
   source: string;
@@ -18,6 +18,8 @@ interface Message {
 
 interface Document {
   id: string;
+  // backend chunk id, used to load the full content on demand
+  documentId?: string;
   title: string;
   excerpt: string;
   source: string;
@@ -42,6 +44,8 @@ interface ApiResponse {
   refined_question?: string | null;
   // retrieved_contexts is an array of arrays of context objects
   retrieved_contexts?: Array<Array<{ id?: string | null; score?: number; content?: string; file?: string }>>;
+  // compact mode: deduplicated documents with short snippets; full content via /api/documents/{id}
+  documents?: Array<{ id?: string | null; score?: number | null; snippet: string }>;
   sources?: ApiSource[];
 }
 
@@ -109,7 +113,8 @@ const Index = () => {
         },
         body: JSON.stringify({
           user_id: userIdRef.current,
-            question: content
+          question: content,
+          compact: true
         })
       });
 
@@ -121,7 +126,21 @@ const Index = () => {
 
       // Extract documents from API response using the new structure
       let extractedDocuments: Document[] = [];
-      if (data.retrieved_contexts && Array.isArray(data.retrieved_contexts)) {
+      if (data.documents && Array.isArray(data.documents)) {
+        extractedDocuments = data.documents.map((doc, index: number) => {
+          const title = doc.id ? `Documento ${doc.id}` : `Documento ${index + 1}`;
+          return {
+            id: doc.id || `doc_${index}`,
+            documentId: doc.id || undefined,
+            title,
+            excerpt: doc.snippet || "Conteúdo não disponível",
+            source: title,
+            relevance: Math.round((doc.score || 0) * 100),
+            date: new Date().getFullYear().toString(),
+            type: "article" as const
+          };
+        });
+      } else if (data.retrieved_contexts && Array.isArray(data.retrieved_contexts)) {
         // Flatten the array of arrays
         const flattenedContexts = data.retrieved_contexts.flat();
         extractedDocuments = flattenedContexts.map((context, index: number) => {
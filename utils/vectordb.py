@@ -2,6 +2,9 @@ import warnings
 warnings.filterwarnings("ignore", message="Api key is used with an insecure connection")
 
 from qdrant_client import QdrantClient
+from qdrant_client.models import Filter, FieldCondition, MatchValue
+from collections import OrderedDict
+import threading
 import litellm
 from dotenv import load_dotenv
 import logging
@@ -42,6 +45,68 @@ except Exception as e:
     print("Make sure Qdrant is running and environment variables are set correctly")
     qdrant_client = None
 
+# Server-side LRU of full chunks keyed by document id, filled on retrieval and
+# read by the document lookup endpoint so repeated lookups skip Qdrant.
+DOCUMENT_CACHE_SIZE = int(os.getenv("DOCUMENT_CACHE_SIZE", "512"))
+_document_cache = OrderedDict()
+_document_cache_lock = threading.Lock()
+
+def cache_document(doc):
+    """Store a retrieved chunk in the document LRU (chunks without id are skipped)."""
+    if doc.get("id") is None:
+        return
+    key = str(doc["id"])
+    with _document_cache_lock:
+        _document_cache[key] = doc
+        _document_cache.move_to_end(key)
+        while len(_document_cache) > DOCUMENT_CACHE_SIZE:
+            _document_cache.popitem(last=False)
+
+def get_document(doc_id):
+    """
+    Look up a single chunk by its payload id, from the LRU first and Qdrant otherwise.
+
+    Args:
+        doc_id (str): The chunk id as returned in the retrieval results
+
+    Returns:
+        dict or None: {'id', 'content'} of the chunk, or None if not found
+    """
+    key = str(doc_id)
+    with _document_cache_lock:
+        if key in _document_cache:
+            _document_cache.move_to_end(key)
+            return _document_cache[key]
+
+    if qdrant_client is None:
+        print("Qdrant client not initialized. Check your configuration.")
+        return None
+
+    # Payload ids may have been stored as strings or integers
+    conditions = [FieldCondition(key="id", match=MatchValue(value=key))]
+    if key.isdigit():
+        conditions.append(FieldCondition(key="id", match=MatchValue(value=int(key))))
+
+    try:
+        points, _ = qdrant_client.scroll(
+            collection_name="sb100_v2",
+            scroll_filter=Filter(should=conditions),
+            limit=1,
+            with_payload=True,
+            with_vectors=False,
+            timeout=30
+        )
+    except Exception as e:
+        print(f"Error fetching document {key}: {e}")
+        return None
+
+    if not points:
+        return None
+
+    doc = {'id': points[0].payload.get("id"), 'content': points[0].payload.get("content")}
+    cache_document(doc)
+    return doc
+
 def get_embedding(text):
 
     # NOTA: Use 'embbeding_service' como hostname e a porta interna '8000'
@@ -116,6 +181,7 @@ def retrieve_documents(query, limit=4, filtro=None):
         # Assuming payload has 'text' field
         result = {'id': point.payload.get("id"), 'score': point.score, 'content': point.payload.get("content")}
         results.append(result)
+        cache_document({'id': result['id'], 'content': result['content']})
 
     print(f"Returning {len(results)} results")
     return results